@@ -13,7 +13,6 @@ robotmesh.com/studio/content/docs/vexv5-python/html/namespacevex.html
 
 
 from collections.abc import Callable, Sequence
-from importlib.metadata import version
 import string
 import sys
 from threading import Thread
@@ -78,7 +77,8 @@ from ._util.type import Num
 
 
 __all__: Sequence[LiteralString] = (
-    '__version__',
+    # resolved lazily by module-level `__getattr__` below
+    '__version__',  # pylint: disable=undefined-all-variable
 
     'Device', 'TriDevice', 'V5DeviceType',
 
@@ -141,7 +141,22 @@ __all__: Sequence[LiteralString] = (
 )
 
 
-__version__: LiteralString = version(distribution_name='VEX-Py')
+def __getattr__(name: str, /) -> LiteralString:
+    """Resolve `__version__` lazily to skip metadata lookup at import."""
+    if name == '__version__':
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            v: LiteralString = version(distribution_name='VEX-Py')
+        except PackageNotFoundError as err:
+            raise AttributeError(f'module {__name__!r} has no attribute '
+                                 f'{name!r}') from err
+
+        globals()['__version__'] = v
+        return v
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 # CONSTANTS
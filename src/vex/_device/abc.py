@@ -29,6 +29,8 @@ __all__: Sequence[LiteralString] = ('Device',)
 class Device:
     """Base Device class."""
 
+    __slots__: Sequence[LiteralString] = ('_port',)
+
     @property
     def port(self: Self, /) -> Ports:
         """Port."""
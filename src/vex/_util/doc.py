@@ -2,12 +2,20 @@
 
 
 from collections.abc import Sequence
+import os
+import sys
 from typing import Any, LiteralString, Self
 
 
 __all__: Sequence[LiteralString] = 'add_doc', 'robotmesh_doc', 'vexcode_doc'
 
 
+# skip docstring augmentation when docstrings are stripped (`python -OO`)
+# or explicitly not wanted (`VEX_STRIP_DOCS=1`)
+_ENABLED: bool = ((sys.flags.optimize < 2) and
+                  (os.environ.get('VEX_STRIP_DOCS') != '1'))
+
+
 # pylint: disable=too-few-public-methods
 
 
@@ -18,23 +26,30 @@ class add_doc:   # noqa: N801
         """Initialize decorator with docstring."""
         self.doc_str: LiteralString = doc_str
 
+    def _format_doc(self: Self) -> str:
+        """Return documentation section to append."""
+        return self.doc_str
+
     def __call__(self: Self, member: Any, /):
         """Add documentation."""
-        member.__doc__ += self.doc_str
+        if not _ENABLED:
+            return member
+
+        member.__doc__ = (member.__doc__ or '') + self._format_doc()
         return member
 
 
 class robotmesh_doc(add_doc):   # noqa: N801
     """Add Robot Mesh Studio documentation."""
 
-    def __init__(self: Self, doc_str: LiteralString = '', /):
-        """Initialize decorator with docstring."""
-        super().__init__(f'\n\nROBOT MESH STUDIO:\n{doc_str}\n')
+    def _format_doc(self: Self) -> str:
+        """Return Robot Mesh Studio documentation section to append."""
+        return f'\n\nROBOT MESH STUDIO:\n{self.doc_str}\n'
 
 
 class vexcode_doc(add_doc):   # noqa: N801
     """Add VEXcode documentation."""
 
-    def __init__(self: Self, doc_str: LiteralString = '', /):
-        """Initialize decorator with docstring."""
-        super().__init__(f'\n\nVEXCODE:\n{doc_str}\n')
+    def _format_doc(self: Self) -> str:
+        """Return VEXcode documentation section to append."""
+        return f'\n\nVEXCODE:\n{self.doc_str}\n'
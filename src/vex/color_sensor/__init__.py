@@ -25,6 +25,12 @@ __all__: Sequence[LiteralString] = 'ColorSensor', 'Colorsensor'
 class ColorSensor(Device):
     """Color Sensor."""
 
+    # `__dict__` is kept for per-instance state recorded by `@sense`,
+    # `__weakref__` so that instances can still be weakly referenced
+    __slots__: Sequence[LiteralString] = ('is_grayscale',
+                                          'proximity_threshold',
+                                          '__dict__', '__weakref__')
+
     @robotmesh_doc("""
         Creates new color sensor object on the port specified in the parameter.
 
@@ -49,7 +55,9 @@ class ColorSensor(Device):
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.port, self.is_grayscale, self.proximity_threshold))
+        return (hash(self.port) ^
+                (hash(self.is_grayscale) * 0x9E3779B97F4A7C15) ^
+                hash(self.proximity_threshold))
 
     @robotmesh_doc("""
         Set the `near` threshold setting.
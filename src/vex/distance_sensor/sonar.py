@@ -2,7 +2,7 @@
 
 
 from collections.abc import Sequence
-from typing import LiteralString, Self, overload
+from typing import LiteralString, Optional, Self, overload
 
 from abm.decor import act, sense
 
@@ -24,6 +24,11 @@ __all__: Sequence[LiteralString] = ('Sonar',)
 class Sonar(Device):
     """Sonar."""
 
+    # `__dict__` is kept for per-instance state recorded by `@sense`,
+    # `__weakref__` so that instances can still be weakly referenced
+    __slots__: Sequence[LiteralString] = ('_max_mm', '_max_in',
+                                          '__dict__', '__weakref__')
+
     @robotmesh_doc("""
         Creates new sonar sensor object on the port specified in the parameter.
 
@@ -34,12 +39,12 @@ class Sonar(Device):
         """Initialize Sonar."""
         self.port: Ports = index
 
-        self.max_distance: dict[DistanceUnits, Num] = \
-            dict[DistanceUnits, Num]()
+        self._max_mm: Optional[Num] = None
+        self._max_in: Optional[Num] = None
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        raise hash(self.port)
+        return hash(self.port)
 
     @robotmesh_doc("""
         Sets the maximum distance (default 2.5m).
@@ -52,7 +57,12 @@ class Sonar(Device):
     def set_maximum(self: Self,
                     distance: Num, distanceUnits: DistanceUnits = MM, /):
         """Set maximum measurable distance."""
-        self.max_distance[distanceUnits] = distance
+        if distanceUnits == MM:
+            self._max_mm = distance
+        elif distanceUnits == INCHES:
+            self._max_in = distance
+        else:
+            raise ValueError('*** UNIT MUST BE MM OR INCHES ***')
 
     @vexcode_doc("""
         Distance Found Object
@@ -14,7 +14,7 @@ from ..motor.turn import TurnType, RIGHT
 from ..time.units import SECONDS
 from .._common_enums.distance import DistanceUnits, MM
 from .._common_enums.rotation import DEGREES
-from .._common_enums.velocity import VelocityUnits, PERCENT
+from .._common_enums.velocity import VelocityUnits, PERCENT, RPM, DPS
 
 from .motor_group import MotorGroup
 
@@ -25,9 +25,22 @@ from .._util.type import Num
 __all__: Sequence[LiteralString] = 'DriveTrain', 'Drivetrain'
 
 
+# index of each velocity unit in `drive_velocities` & `turn_velocities`
+_VELOCITY_IDX: dict[VelocityUnits, int] = {PERCENT: 0, RPM: 1, DPS: 2,
+                                           VelocityUnits.RAW: 3}
+
+
 class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     """Drive Train."""
 
+    __slots__: Sequence[LiteralString] = ('left_motor', 'right_motor',
+                                          'wheel_base', 'track_width',
+                                          'length_unit', 'gear_ratio',
+                                          'drive_velocities',
+                                          'turn_velocities',
+                                          'stopping_mode', 'timeout',
+                                          '_hash')
+
     def __init__(self: Self, left_motor: Motor, right_motor: Motor,
                  wheel_base: float = 200, track_width: float = 176,
                  length_unit: DistanceUnits = MM, gear_ratio: float = 1, /):
@@ -42,17 +55,26 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
         self.length_unit: DistanceUnits = length_unit
         self.gear_ratio: float = gear_ratio
 
-        self.drive_velocities: dict[VelocityUnits, float] = \
-            dict[VelocityUnits, float]()
-        self.turn_velocities: dict[VelocityUnits, float] = \
-            dict[VelocityUnits, float]()
+        # None means velocity not yet set for that unit
+        self.drive_velocities: list[Optional[float]] = [None] * 4
+        self.turn_velocities: list[Optional[float]] = [None] * 4
         self.stopping_mode: Optional[BrakeType] = None
         self.timeout: Optional[float] = None
 
+        # computed on first `__hash__` call, since motors may be unhashable
+        self._hash: Optional[int] = None
+
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
-        return (isinstance(other, DriveTrain) and
-                (other.left_motor == self.left_motor) and
+        if not isinstance(other, DriveTrain):
+            return False
+
+        # pylint: disable=protected-access
+        if ((self._hash is not None) and (other._hash is not None) and
+                (other._hash != self._hash)):
+            return False
+
+        return ((other.left_motor == self.left_motor) and
                 (other.right_motor == self.right_motor) and
                 (other.wheel_base == self.wheel_base) and
                 (other.track_width == self.track_width) and
@@ -61,9 +83,12 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.left_motor, self.right_motor,
-                     self.wheel_base, self.track_width,
-                     self.length_unit, self.gear_ratio))
+        if self._hash is None:
+            self._hash = hash((self.left_motor, self.right_motor,
+                               self.wheel_base, self.track_width,
+                               self.length_unit, self.gear_ratio))
+
+        return self._hash
 
     @vexcode_doc("""
         Drive
@@ -172,7 +197,8 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
                  wait: bool = True):
         # pylint: disable=unused-argument
         """Turn for an angle."""
-        assert units is DEGREES, ValueError('*** ANGULAR UNIT MUST BE DEGREES ***')  # noqa: E501
+        if units is not DEGREES:
+            raise ValueError('*** ANGULAR UNIT MUST BE DEGREES ***')
 
     @vexcode_doc("""
         Stop
@@ -215,7 +241,12 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     def set_drive_velocity(self: Self, velocity: Num = 50,
                            units: VelocityUnits = PERCENT):
         """Set driving velocity."""
-        self.drive_velocities[units] = velocity
+        try:
+            idx: int = _VELOCITY_IDX[units]
+        except KeyError:
+            raise ValueError('*** UNIT MUST BE A VelocityUnits VALUE ***') from None
+
+        self.drive_velocities[idx] = velocity
 
     @vexcode_doc("""
         Set Turn Velocity
@@ -246,7 +277,12 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     def set_turn_velocity(self: Self, velocity: Num = 50,
                           units: VelocityUnits = PERCENT):
         """Set turning velocity."""
-        self.turn_velocities[units] = velocity
+        try:
+            idx: int = _VELOCITY_IDX[units]
+        except KeyError:
+            raise ValueError('*** UNIT MUST BE A VelocityUnits VALUE ***') from None
+
+        self.turn_velocities[idx] = velocity
 
     @vexcode_doc("""
         Set Motor Stopping
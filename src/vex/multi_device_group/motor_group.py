@@ -25,6 +25,11 @@ __all__: Sequence[LiteralString] = ('MotorGroup',)
 class MotorGroup:
     """2-Motor Group."""
 
+    # `__dict__` is kept for per-instance state recorded by `@sense`,
+    # `__weakref__` so that instances can still be weakly referenced
+    __slots__: Sequence[LiteralString] = ('motor_a', 'motor_b',
+                                          '__dict__', '__weakref__')
+
     def __init__(self: Self, motor_a: Motor, motor_b: Motor, /):
         """Initialize 2-Motor Group."""
         self.motor_a: Motor = motor_a
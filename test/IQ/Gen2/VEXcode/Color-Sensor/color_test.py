@@ -24,6 +24,20 @@ class TestColorSensor(unittest.TestCase):
         with replace_stdin("""200"""):
             self.assertEqual(self.colorSensor.hue(), 200)
 
+    def test_eq_hash(self):
+        self.assertEqual(self.colorSensor, ColorSensor(Ports.PORT1, False, 700))
+        self.assertEqual(hash(self.colorSensor), hash(ColorSensor(Ports.PORT1, False, 700.0)))
+        self.assertNotEqual(self.colorSensor, ColorSensor(Ports.PORT2))
+        self.assertNotEqual(self.colorSensor, ColorSensor(Ports.PORT1, True))
+        self.assertNotEqual(self.colorSensor, ColorSensor(Ports.PORT1, False, 700.5))
+        self.assertEqual(len({self.colorSensor, ColorSensor(Ports.PORT1), ColorSensor(Ports.PORT2)}), 2)
+
+    def test_eq_hash_non_finite_threshold(self):
+        for threshold in (float('inf'), float('-inf'), float('nan')):
+            color_sensor = ColorSensor(Ports.PORT1, True, threshold)
+            hash(color_sensor)
+            self.assertNotEqual(color_sensor, self.colorSensor)
+
 if __name__ == "__main__":
     unittest.main()
 
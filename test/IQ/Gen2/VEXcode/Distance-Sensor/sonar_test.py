@@ -0,0 +1,29 @@
+import unittest
+
+from vex import DistanceUnits, Sonar, Ports, MM, INCHES
+
+
+class TestSonar(unittest.TestCase):
+    def setUp(self):
+        self.sonar = Sonar(Ports.PORT1)
+
+    def test_hash(self):
+        self.assertEqual(hash(self.sonar), hash(Ports.PORT1))
+        self.assertEqual(len({self.sonar, Sonar(Ports.PORT1), Sonar(Ports.PORT2)}), 2)
+        self.assertEqual({self.sonar: 1}[Sonar(Ports.PORT1)], 1)
+
+    def test_set_maximum(self):
+        # Sonar API has no getter for maximum distance, so check private slots
+        self.sonar.set_maximum(1000, MM)
+        self.sonar.set_maximum(40, INCHES)
+        self.assertEqual(self.sonar._max_mm, 1000)
+        self.assertEqual(self.sonar._max_in, 40)
+
+        with self.assertRaises(ValueError):
+            self.sonar.set_maximum(10, DistanceUnits.CM)
+        self.assertEqual(self.sonar._max_mm, 1000)
+        self.assertEqual(self.sonar._max_in, 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
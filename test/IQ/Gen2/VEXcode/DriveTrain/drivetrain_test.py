@@ -1,7 +1,8 @@
 import unittest
 
 from vex import DriveTrain
-from vex import Motor, Ports, DEGREES, PERCENT, FORWARD, REVERSE, MM, LEFT, CurrentUnits
+from vex import (Motor, Ports, DEGREES, TURNS, PERCENT, RPM, FORWARD, REVERSE, MM, LEFT,
+                 CurrentUnits, VelocityUnits)
 from vex._util.io import replace_stdin
 
 
@@ -29,6 +30,32 @@ class TestDriveTrain(unittest.TestCase):
         self.drivetrain.turn_for(LEFT, 12.3, DEGREES),
         self.drivetrain.turn_for(LEFT, 12.3, DEGREES, True)
 
+    def test_turn_for_non_degree_unit(self):
+        with self.assertRaises(ValueError):
+            self.drivetrain.turn_for(LEFT, 12.3, TURNS)
+
+    def test_set_drive_velocity(self):
+        self.drivetrain.set_drive_velocity(12.3, PERCENT)
+        self.drivetrain.set_drive_velocity(45.6, RPM)
+        self.drivetrain.set_drive_velocity(78.9, VelocityUnits.RAW)
+        self.assertEqual(self.drivetrain.drive_velocities, [12.3, 45.6, None, 78.9])
+
+        for units in (3, -1, 100):
+            with self.assertRaises(ValueError):
+                self.drivetrain.set_drive_velocity(1, units)
+        self.assertEqual(self.drivetrain.drive_velocities, [12.3, 45.6, None, 78.9])
+
+    def test_set_turn_velocity(self):
+        self.drivetrain.set_turn_velocity(12.3, PERCENT)
+        self.drivetrain.set_turn_velocity(45.6, RPM)
+        self.drivetrain.set_turn_velocity(78.9, VelocityUnits.RAW)
+        self.assertEqual(self.drivetrain.turn_velocities, [12.3, 45.6, None, 78.9])
+
+        for units in (3, -1, 100):
+            with self.assertRaises(ValueError):
+                self.drivetrain.set_turn_velocity(1, units)
+        self.assertEqual(self.drivetrain.turn_velocities, [12.3, 45.6, None, 78.9])
+
     # def test_turn_to_heading(self):
     #     self.assertEqual(
     #         self.drivetrain.turn_to_heading(12.3),
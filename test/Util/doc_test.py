@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from vex._util.doc import robotmesh_doc, vexcode_doc
+
+
+# decorated in a fresh interpreter, since doc decoration is gated at import
+_DECORATED_DOC_SCRIPT = '''
+import vex
+from vex._util.doc import robotmesh_doc, vexcode_doc
+
+@vexcode_doc("""VEXcode doc.""")
+@robotmesh_doc("""Robot Mesh doc.""")
+def func():
+    """Docstring."""
+
+print(repr(func.__doc__))
+'''
+
+
+def run_decorated_doc_script(*python_flags, **env_vars):
+    env = {k: v for k, v in os.environ.items() if k != 'VEX_STRIP_DOCS'}
+    env.update(env_vars)
+    return subprocess.run([sys.executable, *python_flags, '-c', _DECORATED_DOC_SCRIPT],
+                          capture_output=True, check=True, env=env, text=True).stdout.strip()
+
+
+class TestDoc(unittest.TestCase):
+    def test_decorated(self):
+        self.assertEqual(run_decorated_doc_script(),
+                         repr('Docstring.'
+                              '\n\nROBOT MESH STUDIO:\nRobot Mesh doc.\n'
+                              '\n\nVEXCODE:\nVEXcode doc.\n'))
+
+    def test_undecorated_when_docstrings_stripped(self):
+        self.assertEqual(run_decorated_doc_script('-OO'), repr(None))
+
+    def test_undecorated_when_vex_strip_docs_set(self):
+        self.assertEqual(run_decorated_doc_script(VEX_STRIP_DOCS='1'), repr('Docstring.'))
+
+    @unittest.skipIf((sys.flags.optimize >= 2) or (os.environ.get('VEX_STRIP_DOCS') == '1'),
+                     'doc decoration disabled')
+    def test_decorated_without_docstring(self):
+        @vexcode_doc("""VEXcode doc.""")
+        def vexcode_func():
+            pass
+
+        @robotmesh_doc("""Robot Mesh doc.""")
+        def robotmesh_func():
+            pass
+
+        self.assertEqual(vexcode_func.__doc__, '\n\nVEXCODE:\nVEXcode doc.\n')
+        self.assertEqual(robotmesh_func.__doc__, '\n\nROBOT MESH STUDIO:\nRobot Mesh doc.\n')
+
+
+if __name__ == "__main__":
+    unittest.main()